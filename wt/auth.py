@@ -1,11 +1,21 @@
 """GitHub authentication management."""
 
+import functools
+import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 import yaml
 from github import Auth, Github, GithubException
+from github.AuthenticatedUser import AuthenticatedUser
+
+# Prefer the LibYAML C bindings when available; parsing drops into C
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from wt.ui.console import ask_password, console, print_error, print_info, print_warning
 
@@ -14,6 +24,14 @@ from wt.ui.console import ask_password, console, print_error, print_info, print_
 CONFIG_DIR = Path.home() / ".config" / "wt"
 CONFIG_FILE = CONFIG_DIR / "config.yml"
 
+# Cache of the last parsed config, keyed on (mtime, size) so repeated reads
+# of an unchanged file skip the open + YAML parse entirely
+_TOKEN_CACHE: dict[tuple[float, int], Optional[str]] = {}
+
+# Token resolved earlier in this process; lets repeated get_github_token()
+# calls skip even the environ lookup
+_RESOLVED_TOKEN: Optional[str] = None
+
 
 def _read_stored_token() -> Optional[str]:
     """
@@ -26,9 +44,23 @@ def _read_stored_token() -> Optional[str]:
         return None
 
     try:
-        with open(CONFIG_FILE) as f:
-            config = yaml.safe_load(f)
-            return config.get("github_token")
+        st = CONFIG_FILE.stat()
+        key = (st.st_mtime, st.st_size)
+        if key in _TOKEN_CACHE:
+            return _TOKEN_CACHE[key]
+
+        # We write the config as JSON (a YAML subset), so try the much
+        # cheaper JSON parse first and fall back to YAML for older files
+        raw = CONFIG_FILE.read_text()
+        try:
+            config = json.loads(raw)
+        except json.JSONDecodeError:
+            config = yaml.load(raw, Loader=_YamlLoader)
+        token = config.get("github_token")
+
+        _TOKEN_CACHE.clear()
+        _TOKEN_CACHE[key] = token
+        return token
     except Exception:
         # Silently fail if we can't read the config
         return None
@@ -44,13 +76,26 @@ def _store_token(token: str) -> None:
     # Create config directory if it doesn't exist
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Write token to config file
-    config = {"github_token": token}
-    with open(CONFIG_FILE, "w") as f:
-        yaml.safe_dump(config, f)
+    # Write token to config file as JSON, which is a valid YAML subset and
+    # avoids dragging in the YAML emitter for a single-key dict
+    config = json.dumps({"github_token": token})
 
-    # Set secure permissions (owner read/write only)
-    CONFIG_FILE.chmod(0o600)
+    if os.name == "posix":
+        # Create with owner-only permissions up front so the token is never
+        # world-readable, even briefly, and no separate chmod is needed
+        fd = os.open(CONFIG_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(config)
+    else:
+        # os.open mode bits don't map to permissions on Windows; keep the
+        # write-then-chmod path there
+        CONFIG_FILE.write_text(config)
+        CONFIG_FILE.chmod(0o600)
+
+    # Invalidate the caches so the new token is picked up
+    global _RESOLVED_TOKEN
+    _RESOLVED_TOKEN = None
+    _TOKEN_CACHE.clear()
 
 
 def _prompt_for_token() -> str:
@@ -92,15 +137,24 @@ def get_github_token(force_prompt: bool = False) -> str:
     Returns:
         GitHub personal access token.
     """
+    global _RESOLVED_TOKEN
+
     if not force_prompt:
-        # Check environment variables first
-        if token := os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN"):
+        # Serve the token already resolved earlier in this process
+        if _RESOLVED_TOKEN is not None:
+            return _RESOLVED_TOKEN
+
+        # Check environment variables first (single environ scan)
+        environ = os.environ
+        if token := next((environ[k] for k in ("GITHUB_TOKEN", "GH_TOKEN") if k in environ), None):
             print_info("Using token from environment variable")
+            _RESOLVED_TOKEN = token
             return token
 
         # Check stored token
         if token := _read_stored_token():
             print_info(f"Using stored token from [dim]{CONFIG_FILE}[/dim]")
+            _RESOLVED_TOKEN = token
             return token
 
     # Prompt user and store token
@@ -108,18 +162,53 @@ def get_github_token(force_prompt: bool = False) -> str:
     _store_token(token)
     print_info(f"Token stored securely in [dim]{CONFIG_FILE}[/dim]")
 
+    _RESOLVED_TOKEN = token
     return token
 
 
-def create_github_client(token: Optional[str] = None) -> Github:
+@dataclass(frozen=True)
+class AuthContext:
+    """Authenticated GitHub client, user, and the token that backs them."""
+
+    client: Github
+    user: AuthenticatedUser
+    token: str
+
+
+@functools.lru_cache(maxsize=4)
+def _build_client(token: str) -> tuple[Github, AuthenticatedUser]:
     """
-    Create authenticated GitHub client with token expiration handling.
+    Build and validate an authenticated client for a token.
+
+    Memoized per token so repeated calls within a process reuse the same
+    client and already-fetched user instead of hitting /user again.
+
+    Args:
+        token: GitHub personal access token.
+
+    Returns:
+        Tuple of (client, authenticated user).
+    """
+    auth = Auth.Token(token)
+    client = Github(auth=auth)
+
+    # Validate token by getting authenticated user; accessing .login forces
+    # the /user fetch so invalid tokens fail here rather than later
+    user = client.get_user()
+    user.login
+    return client, user
+
+
+def create_auth_context(token: Optional[str] = None) -> AuthContext:
+    """
+    Create an authenticated GitHub context with token expiration handling.
 
     Args:
         token: Optional token. If not provided, will use get_github_token().
 
     Returns:
-        Authenticated Github client.
+        AuthContext bundling the client, authenticated user, and token, so
+        callers never need to re-extract the token from client internals.
 
     Raises:
         SystemExit: If authentication fails after retrying.
@@ -127,32 +216,46 @@ def create_github_client(token: Optional[str] = None) -> Github:
     if token is None:
         token = get_github_token()
 
-    auth = Auth.Token(token)
-    client = Github(auth=auth)
-
-    # Validate token by getting authenticated user
-    try:
-        user = client.get_user()
-        login = user.login
-        print_info(f"Authenticated as: [bold]{login}[/bold]")
-        return client
-    except GithubException as e:
-        error_message = e.data.get("message", str(e)) if hasattr(e, "data") else str(e)
-
-        # Check if token is expired or invalid
-        if e.status in (401, 403):
-            print_error(f"Authentication failed: {error_message}")
-            print_warning("Your token may be expired or invalid.")
-            console.print()
-
-            # Prompt for new token
-            new_token = _prompt_for_token()
-            _store_token(new_token)
-            print_info(f"New token stored in [dim]{CONFIG_FILE}[/dim]")
-
-            # Retry with new token
-            return create_github_client(token=new_token)
-        else:
-            # Other error, don't retry
+    # Two attempts: the original token, then one freshly-prompted replacement.
+    # Iterating instead of recursing keeps the call stack shallow and builds
+    # only one client on the happy path.
+    for attempt in range(2):
+        try:
+            client, user = _build_client(token)
+            print_info(f"Authenticated as: [bold]{user.login}[/bold]")
+            return AuthContext(client=client, user=user, token=token)
+        except GithubException as e:
+            error_message = e.data.get("message", str(e)) if hasattr(e, "data") else str(e)
             print_error(f"Authentication failed: {error_message}")
+
+            # Check if token is expired or invalid
+            if e.status in (401, 403) and attempt == 0:
+                print_warning("Your token may be expired or invalid.")
+                console.print()
+
+                # Prompt for new token and retry with it
+                token = _prompt_for_token()
+                _store_token(token)
+                print_info(f"New token stored in [dim]{CONFIG_FILE}[/dim]")
+                continue
+
+            # Other error (or a second failure), don't retry
             raise SystemExit(1)
+
+    raise SystemExit(1)
+
+
+def create_github_client(token: Optional[str] = None) -> Github:
+    """
+    Create authenticated GitHub client with token expiration handling.
+
+    Args:
+        token: Optional token. If not provided, will use get_github_token().
+
+    Returns:
+        Authenticated Github client.
+
+    Raises:
+        SystemExit: If authentication fails after retrying.
+    """
+    return create_auth_context(token).client
@@ -4,7 +4,6 @@ import typer
 from typing_extensions import Annotated
 
 from wt import __version__
-from wt.ui.console import console
 
 app = typer.Typer(
     name="wt",
@@ -16,7 +15,8 @@ app = typer.Typer(
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console.print(f"wt version {__version__}")
+        # Plain print keeps `wt --version` from importing rich
+        print(f"wt version {__version__}")
         raise typer.Exit()
 
 
@@ -92,6 +92,13 @@ def create(
             help="Preview actions without making changes",
         ),
     ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            help="Print full tracebacks on errors",
+        ),
+    ] = False,
 ) -> None:
     """
     Create a new ecoscope workflow repository from template.
@@ -123,6 +130,7 @@ def create(
         collaborators=collaborators,
         skip_collaborators=skip_collaborators,
         dry_run=dry_run,
+        verbose=verbose,
     )
 
 
@@ -1,13 +1,29 @@
 """Repository creation command."""
 
 import json
+import os
+import re
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 import requests
 from github import Github
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from wt.auth import create_github_client
+from wt.auth import CONFIG_DIR, create_auth_context
+
+# Prefer orjson's native JSON codec when available; fall back to the stdlib
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: dict) -> bytes:
+        return json.dumps(obj).encode()
 from wt.ui.console import (
     ask,
     confirm,
@@ -21,6 +37,31 @@ from wt.ui.console import (
     print_warning,
 )
 
+# Static GitHub REST headers, built once at import; only the Authorization
+# header varies per request
+_GH_BASE_HEADERS = MappingProxyType({
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+})
+
+# Shared HTTP session so GitHub REST calls reuse one pooled keep-alive
+# connection (amortizes the TLS handshake) and retry transient server errors
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+_SESSION.headers.update(_GH_BASE_HEADERS)
+
+# On-disk cache for the fetched branch rules; storing the ETag lets us send
+# If-None-Match and skip the body transfer when the file hasn't changed
+_RULES_CACHE_FILE = CONFIG_DIR / "ecoscope_main_branch_rules.json"
+_RULES_ETAG_FILE = CONFIG_DIR / "ecoscope_main_branch_rules.json.etag"
+
 # Valid GitHub repository permission levels
 # Note: GitHub API uses 'pull' and 'push' internally, but we expose as 'read' and 'write'
 VALID_ROLES = {
@@ -37,6 +78,52 @@ ROLE_ALIASES = {
     "push": "push",
 }
 
+# Merged, read-only role map so resolving a role is a single dict lookup;
+# unknown roles are rejected client-side before any API call is made
+_ROLE_MAP = MappingProxyType({**ROLE_ALIASES, **VALID_ROLES})
+
+# One-pass tokenizer for "user1:role1,user2:role2" collaborator specs
+_COLLAB_RE = re.compile(r"\s*([^:,\s]+)\s*:\s*([^,\s]+)\s*")
+
+
+def _fetch_branch_rules(url: str) -> Optional[dict]:
+    """
+    Fetch the branch rules JSON, revalidating a cached copy via ETag.
+
+    Args:
+        url: URL of the branch rules JSON file.
+
+    Returns:
+        Parsed rules dict, or None if the fetch failed.
+    """
+    headers = {}
+    if _RULES_CACHE_FILE.exists() and _RULES_ETAG_FILE.exists():
+        headers["If-None-Match"] = _RULES_ETAG_FILE.read_text().strip()
+
+    response = _SESSION.get(url, headers=headers)
+
+    # 304 means our cached copy is still current; serve it without a transfer
+    if response.status_code == 304:
+        return _json_loads(_RULES_CACHE_FILE.read_bytes())
+
+    if response.status_code != 200:
+        print_error(f"Failed to fetch branch rules from GitHub: {response.status_code}")
+        return None
+
+    # Cache body + ETag atomically for the next run; caching is best-effort
+    etag = response.headers.get("ETag")
+    if etag:
+        try:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = _RULES_CACHE_FILE.with_suffix(".json.tmp")
+            tmp_file.write_bytes(response.content)
+            os.replace(tmp_file, _RULES_CACHE_FILE)
+            _RULES_ETAG_FILE.write_text(etag)
+        except OSError:
+            pass
+
+    return _json_loads(response.content)
+
 
 def create_repository(
     name: str,
@@ -46,6 +133,7 @@ def create_repository(
     collaborators: str,
     skip_collaborators: bool,
     dry_run: bool,
+    verbose: bool = False,
 ) -> None:
     """
     Create a new repository from template.
@@ -58,6 +146,7 @@ def create_repository(
         collaborators: Comma-separated collaborators
         skip_collaborators: Skip adding collaborators
         dry_run: Preview without executing
+        verbose: Print full tracebacks on errors
     """
     # Template and branch rules are always the same
     template = "wildlife-dynamics/wt-template"
@@ -118,25 +207,30 @@ def create_repository(
         raise SystemExit(1)
 
 
-    # Create GitHub client and get current user
-    client = create_github_client()
-    current_user = client.get_user().login
+    # Create GitHub client and reuse the already-fetched authenticated user;
+    # a fresh client.get_user().login would cost another /user round-trip
+    auth = create_auth_context()
+    client = auth.client
+    user_obj = auth.user
+    current_user = user_obj.login
 
     # Parse collaborators and add current user as admin by default
     collab_list = []
     if not skip_collaborators:
         if collaborators:
-            for collab in collaborators.split(","):
-                collab = collab.strip()
-                if ":" in collab:
-                    username, role = collab.split(":", 1)
-                    role = role.strip().lower()
-                    # Map user-friendly names to GitHub API names
-                    api_role = VALID_ROLES.get(role, ROLE_ALIASES.get(role, role))
-                    collab_list.append((username.strip(), api_role))
+            # Tokenize in one regex pass and map user-friendly role names to
+            # GitHub API names with a single lookup per entry; unknown roles
+            # are dropped here so no API call is wasted on a typo
+            for username, role in _COLLAB_RE.findall(collaborators):
+                api_role = _ROLE_MAP.get(role.lower())
+                if api_role is None:
+                    print_warning(f"Skipping [bold]{username}[/bold]: unknown role '{role}'")
+                    continue
+                collab_list.append((username, api_role))
 
         # Add current user as admin if not already in the list
-        if not any(username == current_user for username, _ in collab_list):
+        usernames = {username for username, _ in collab_list}
+        if current_user not in usernames:
             collab_list.insert(0, (current_user, "admin"))
             print_info(f"Adding current user [bold]{current_user}[/bold] as admin")
 
@@ -172,18 +266,28 @@ def create_repository(
     console.print()
     print_step(2, 4, "Creating Repository")
 
-    try:
-        # Parse template owner/repo
-        template_owner, template_repo = template.split("/", 1)
+    # The branch-rules download is independent of repository creation, so
+    # start it in the background and overlap it with the creation round-trips
+    rules_future = None
+    if org:
+        _rules_pool = ThreadPoolExecutor(max_workers=1)
+        rules_future = _rules_pool.submit(_fetch_branch_rules, branch_rules_url)
+        _rules_pool.shutdown(wait=False)
 
-        # Get template repository
-        with create_progress() as progress:
+    # One spinner shared across all steps; each sub-step adds and removes a
+    # task instead of spinning up a fresh live display per call
+    with create_progress() as progress:
+        try:
+            # Parse template owner/repo
+            template_owner, template_repo = template.split("/", 1)
+
+            # Get template repository
             task = progress.add_task("Fetching template repository...", total=None)
             template_repo_obj = client.get_repo(template)
             progress.update(task, completed=True)
+            progress.remove_task(task)
 
-        # Create repository from template
-        with create_progress() as progress:
+            # Create repository from template
             task = progress.add_task(f"Creating repository {name}...", total=None)
 
             if org:
@@ -197,8 +301,7 @@ def create_repository(
                 )
             else:
                 # Create in personal account
-                user = client.get_user()
-                new_repo = user.create_repo_from_template(
+                new_repo = user_obj.create_repo_from_template(
                     name=name,
                     repo=template_repo_obj,
                     description=description,
@@ -206,99 +309,107 @@ def create_repository(
                 )
 
             progress.update(task, completed=True)
+            progress.remove_task(task)
 
-        print_success(f"Repository created: [bold]{new_repo.full_name}[/bold]")
-        console.print(f"  [dim]→[/dim] {new_repo.html_url}")
+            print_success(f"Repository created: [bold]{new_repo.full_name}[/bold]")
+            console.print(f"  [dim]→[/dim] {new_repo.html_url}")
 
-    except Exception as e:
-        print_error(f"Failed to create repository: {e}")
-        raise SystemExit(1)
+        except Exception as e:
+            print_error(f"Failed to create repository: {e}")
+            raise SystemExit(1)
+
+        # Add collaborators
+        if collab_list and not skip_collaborators:
+            console.print()
+            print_step(3, 4, "Adding Collaborators")
+
+            # Get repository owner to skip them
+            repo_owner = new_repo.owner.login
+
+            # Skip the repository owner, then add the rest
+            to_add = []
+            for username, role in collab_list:
+                if username.lower() == repo_owner.lower():
+                    print_info(f"Skipping [bold]{username}[/bold] (repository owner)")
+                    continue
+                to_add.append((username, role))
+
+            if to_add:
+                # Each addition is an independent HTTPS round-trip, so issue them
+                # in parallel instead of paying one round-trip per user serially
+                task = progress.add_task(f"Adding {len(to_add)} collaborator(s)...", total=None)
+                with ThreadPoolExecutor(max_workers=min(8, len(to_add))) as executor:
+                    futures = {
+                        executor.submit(new_repo.add_to_collaborators, username, permission=role): (username, role)
+                        for username, role in to_add
+                    }
+                    for future in as_completed(futures):
+                        username, role = futures[future]
+                        try:
+                            future.result()
+                            print_success(f"Added [bold]{username}[/bold] ({role})")
+                        except Exception as e:
+                            print_error(f"Failed to add {username}: {e}")
+                            if verbose:
+                                console.print(f"  [dim]{traceback.format_exc()}[/dim]")
+                progress.update(task, completed=True)
+                progress.remove_task(task)
 
-    # Add collaborators
-    if collab_list and not skip_collaborators:
+        # Apply branch protection rules (only for organization repos)
+        # Note: Repository rulesets require GitHub Pro for personal accounts
         console.print()
-        print_step(3, 4, "Adding Collaborators")
-
-        # Get repository owner to skip them
-        repo_owner = new_repo.owner.login
-
-        for username, role in collab_list:
-            # Skip if user is the repository owner
-            if username.lower() == repo_owner.lower():
-                print_info(f"Skipping [bold]{username}[/bold] (repository owner)")
-                continue
+        print_step(4, 4, "Applying Branch Protection Rules")
 
+        if not org:
+            print_info("Skipping branch protection rules (personal repository)")
+            console.print("[dim]Private repository rulesets require GitHub Pro for personal accounts[/dim]")
+            console.print("[dim]You can manually add branch protection in Settings → Branches[/dim]")
+        else:
             try:
-                with create_progress() as progress:
-                    task = progress.add_task(f"Adding {username} as {role}...", total=None)
-                    new_repo.add_to_collaborators(username, permission=role)
-                    progress.update(task, completed=True)
-                print_success(f"Added [bold]{username}[/bold] ({role})")
-            except Exception as e:
-                print_error(f"Failed to add {username}: {e}")
-                import traceback
-                console.print(f"  [dim]{traceback.format_exc()}[/dim]")
-
-    # Apply branch protection rules (only for organization repos)
-    # Note: Repository rulesets require GitHub Pro for personal accounts
-    console.print()
-    print_step(4, 4, "Applying Branch Protection Rules")
-
-    if not org:
-        print_info("Skipping branch protection rules (personal repository)")
-        console.print("[dim]Private repository rulesets require GitHub Pro for personal accounts[/dim]")
-        console.print("[dim]You can manually add branch protection in Settings → Branches[/dim]")
-    else:
-        try:
-            # Fetch rules from GitHub
-            with create_progress() as progress:
+                # Collect the rules fetched in the background during repo creation
                 task = progress.add_task("Fetching branch rules from GitHub...", total=None)
-                rules_response = requests.get(branch_rules_url)
+                rules_data = rules_future.result()
                 progress.update(task, completed=True)
+                progress.remove_task(task)
+
+                if rules_data is None:
+                    print_info("Skipping branch protection rules")
+                else:
+                    # Apply ruleset using GitHub REST API
+                    # PyGithub doesn't support rulesets yet, so we use requests directly
+                    headers = {
+                        "Authorization": f"Bearer {auth.token}",
+                        "Content-Type": "application/json",
+                    }
+
+                    # Prepare ruleset payload
+                    ruleset_payload = {
+                        "name": rules_data.get("name", "Main Branch Rules"),
+                        "target": rules_data.get("target", "branch"),
+                        "enforcement": rules_data.get("enforcement", "active"),
+                        "conditions": rules_data.get("conditions", {}),
+                        "rules": rules_data.get("rules", []),
+                        "bypass_actors": rules_data.get("bypass_actors", []),
+                    }
+
+                    # Create ruleset
+                    api_url = f"https://api.github.com/repos/{new_repo.full_name}/rulesets"
 
-            if rules_response.status_code != 200:
-                print_error(f"Failed to fetch branch rules from GitHub: {rules_response.status_code}")
-                print_info("Skipping branch protection rules")
-            else:
-                rules_data = rules_response.json()
-
-                # Apply ruleset using GitHub REST API
-                # PyGithub doesn't support rulesets yet, so we use requests directly
-                token = client._Github__requester._Requester__auth.token
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                }
-
-                # Prepare ruleset payload
-                ruleset_payload = {
-                    "name": rules_data.get("name", "Main Branch Rules"),
-                    "target": rules_data.get("target", "branch"),
-                    "enforcement": rules_data.get("enforcement", "active"),
-                    "conditions": rules_data.get("conditions", {}),
-                    "rules": rules_data.get("rules", []),
-                    "bypass_actors": rules_data.get("bypass_actors", []),
-                }
-
-                # Create ruleset
-                api_url = f"https://api.github.com/repos/{new_repo.full_name}/rulesets"
-
-                with create_progress() as progress:
                     task = progress.add_task("Creating branch protection ruleset...", total=None)
-                    response = requests.post(api_url, headers=headers, json=ruleset_payload)
+                    response = _SESSION.post(api_url, headers=headers, data=_json_dumps(ruleset_payload))
                     progress.update(task, completed=True)
+                    progress.remove_task(task)
 
-                if response.status_code == 201:
-                    print_success("Branch protection rules applied")
-                else:
-                    print_error(f"Failed to apply branch rules: {response.status_code}")
-                    console.print(f"  [dim]{response.text}[/dim]")
+                    if response.status_code == 201:
+                        print_success("Branch protection rules applied")
+                    else:
+                        print_error(f"Failed to apply branch rules: {response.status_code}")
+                        console.print(f"  [dim]{response.text}[/dim]")
 
-        except Exception as e:
-            print_error(f"Failed to apply branch protection rules: {e}")
-            import traceback
-            console.print(f"  [dim]{traceback.format_exc()}[/dim]")
+            except Exception as e:
+                print_error(f"Failed to apply branch protection rules: {e}")
+                if verbose:
+                    console.print(f"  [dim]{traceback.format_exc()}[/dim]")
 
     console.print()
     print_success("Repository setup complete!")
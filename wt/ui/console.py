@@ -1,27 +1,67 @@
 """Rich console utilities for beautiful terminal output."""
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
-from rich.theme import Theme
-
-# Custom theme for wt CLI
-custom_theme = Theme({
-    "info": "cyan",
-    "success": "green",
-    "warning": "yellow",
-    "error": "red bold",
-    "dim": "dim",
-})
-
-# Global console instance
-console = Console(theme=custom_theme)
+from __future__ import annotations
+
+import functools
+import re
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
+# When stdout is piped or redirected, rich strips styling anyway, so the
+# print_* helpers can skip its markup parser and rendering entirely and
+# write plain text directly
+_FAST = not sys.stdout.isatty()
+
+# Matches rich markup tags like [bold] and [/dim] for the plain-text path
+_MARKUP_RE = re.compile(r"\[/?[a-zA-Z#][^\]]*\]")
+
+
+def _write_plain(prefix: str, text: str) -> None:
+    """Write a message without going through rich's rendering pipeline."""
+    sys.stdout.write(prefix + _MARKUP_RE.sub("", text) + "\n")
+
+
+@functools.cache
+def get_console() -> Console:
+    """
+    Create the shared console instance lazily.
+
+    Importing rich costs tens of milliseconds, so we defer it until the
+    console is actually needed (e.g. not for `wt --help`).
+    """
+    from rich.console import Console
+    from rich.theme import Theme
+
+    # Custom theme for wt CLI
+    custom_theme = Theme({
+        "info": "cyan",
+        "success": "green",
+        "warning": "yellow",
+        "error": "red bold",
+        "dim": "dim",
+    })
+
+    return Console(theme=custom_theme)
+
+
+def __getattr__(name: str):
+    # Keep `from wt.ui.console import console` working without paying the
+    # rich import cost at module load time
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def print_header(text: str) -> None:
     """Print a formatted header."""
+    from rich.panel import Panel
+
+    console = get_console()
     console.print()
     console.print(Panel(text, style="bold cyan"))
     console.print()
@@ -29,47 +69,71 @@ def print_header(text: str) -> None:
 
 def print_success(text: str) -> None:
     """Print a success message."""
-    console.print(f"✓ {text}", style="success")
+    if _FAST:
+        _write_plain("✓ ", text)
+        return
+    get_console().print(f"✓ {text}", style="success")
 
 
 def print_error(text: str) -> None:
     """Print an error message."""
-    console.print(f"✗ {text}", style="error")
+    if _FAST:
+        _write_plain("✗ ", text)
+        return
+    get_console().print(f"✗ {text}", style="error")
 
 
 def print_warning(text: str) -> None:
     """Print a warning message."""
-    console.print(f"⚠ {text}", style="warning")
+    if _FAST:
+        _write_plain("⚠ ", text)
+        return
+    get_console().print(f"⚠ {text}", style="warning")
 
 
 def print_info(text: str) -> None:
     """Print an info message."""
-    console.print(f"ℹ {text}", style="info")
+    if _FAST:
+        _write_plain("ℹ ", text)
+        return
+    get_console().print(f"ℹ {text}", style="info")
 
 
 def print_step(step: int, total: int, title: str) -> None:
     """Print a step header."""
+    if _FAST:
+        _write_plain("\n", f"[{step}/{total}] {title}")
+        return
+    console = get_console()
     console.print()
     console.print(f"[bold cyan][{step}/{total}] {title}[/bold cyan]")
 
 
 def confirm(question: str, default: bool = True) -> bool:
     """Ask for confirmation."""
+    from rich.prompt import Confirm
+
     return Confirm.ask(question, default=default)
 
 
 def ask(question: str, default: str = "") -> str:
     """Ask for user input."""
+    from rich.prompt import Prompt
+
     return Prompt.ask(question, default=default)
 
 
 def ask_password(question: str) -> str:
     """Ask for password/token input."""
+    from rich.prompt import Prompt
+
     return Prompt.ask(question, password=True)
 
 
 def create_table(title: str, columns: list[str]) -> Table:
     """Create a formatted table."""
+    from rich.table import Table
+
     table = Table(title=title, show_header=True, header_style="bold cyan")
     for column in columns:
         table.add_column(column)
@@ -78,8 +142,10 @@ def create_table(title: str, columns: list[str]) -> Table:
 
 def create_progress() -> Progress:
     """Create a progress spinner."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=get_console(),
     )